@@ -6,8 +6,11 @@
  */
 
 import { useState, useCallback } from 'react';
-import { validateFile } from '@/lib/utils/fileValidation';
-import { createPreviewFromFile, createThumbnailFromDataUrl } from '@/lib/utils/imageCompression';
+import { validateFile, FILE_SIZE_LIMITS } from '@/lib/utils/fileValidation';
+import { compressImageForStorage, createPreviewFromFile, createThumbnailFromDataUrl } from '@/lib/utils/imageCompression';
+
+// Longest side kept when downscaling oversized photos for OCR; plenty for receipt text
+const ANALYSIS_MAX_DIMENSION = 3000;
 
 export const useReceiptUpload = () => {
   const [selectedImage, setSelectedImage] = useState(null);
@@ -93,9 +96,27 @@ export const useReceiptUpload = () => {
     setError(null);
 
     try {
-      // Upload to GCS first (we send the original file as-is for Document AI)
-      // Note: do NOT compress the file before analysis — Document AI should get the original image
-      const { gcsUrl, readUrl } = await uploadToGCS(selectedImage);
+      // Upload to GCS first. Document AI should get the original image, so only
+      // oversized photos (beyond the analysis limit) are downscaled beforehand;
+      // this cuts upload time and server-side decode/resize for 12MP+ photos.
+      let analysisFile = selectedImage;
+      if (selectedImage.size > FILE_SIZE_LIMITS.ANALYSIS_MAX) {
+        try {
+          const downscaled = await compressImageForStorage(selectedImage, {
+            targetBytes: FILE_SIZE_LIMITS.ANALYSIS_MAX,
+            maxDimension: ANALYSIS_MAX_DIMENSION,
+            minQuality: 0.8
+          });
+          // Only use the downscaled copy if it is a real, smaller image
+          if (downscaled?.size > 0 && downscaled.size < selectedImage.size) {
+            analysisFile = downscaled;
+          }
+        } catch (compressErr) {
+          console.warn('Downscaling before analysis failed, using original:', compressErr);
+          analysisFile = selectedImage;
+        }
+      }
+      const { gcsUrl, readUrl } = await uploadToGCS(analysisFile);
 
       // Send GCS URL to analysis API
       const response = await fetch('/api/analyze', {
@@ -33,6 +33,12 @@ export const formatCurrency = (amount, currency = 'EUR') => {
  * - Numbers (passthrough)
  * - String prices with currency symbols
  * - German decimal separator (comma)
+ * - Thousands grouping only alongside a decimal separator ("1.234,56") or when
+ *   repeated ("1.234.567"); a single separator is always the decimal point,
+ *   so "1,234" and "1.234" both parse as 1.234
+ * - Only the first number in the string is read:
+ *   "12,50 €" -> 12.5, "-0,99 EUR" -> -0.99, "Pfand 0,25 2,00" -> 0.25,
+ *   "1,99 2,99" -> 1.99, "0,5l 1,29" -> 0.5, "3,49 A 1" -> 3.49
  * - Object prices with nested value properties
  * - Receipt API objects with price.value structure
  * 
@@ -48,13 +54,53 @@ export const parsePrice = (priceInput) => {
     return parsePrice(priceInput.value); // Recursive call for nested objects
   }
   
-  // Clean and standardize price string format
-  const cleanPrice = priceInput.toString()
-    .replace(/[^\d,.-]/g, '') // Remove currency symbols and letters
-    .replace(',', '.'); // Convert German decimal separator to standard format
+  // Single pass over the string: skip currency symbols and labels before the
+  // number, then read digits and separators until the first other character,
+  // so neighbouring numbers ("1,99 2,99", "0,5l 1,29") are never joined
+  const str = priceInput.toString();
+  let digits = '';
+  let negative = false;
+  let commaCount = 0;
+  let dotCount = 0;
+  let lastSep = null;     // Last separator character seen
+  let lastSepAt = -1;     // Number of digits before the last separator
+
+  for (let i = 0; i < str.length; i++) {
+    const ch = str[i];
+    if (ch >= '0' && ch <= '9') {
+      digits += ch;
+    } else if ((ch === ',' || ch === '.') && str[i + 1] >= '0' && str[i + 1] <= '9') {
+      // Only a separator followed by a digit belongs to the number
+      if (ch === ',') commaCount++;
+      else dotCount++;
+      lastSep = ch;
+      lastSepAt = digits.length;
+    } else if (digits.length > 0) {
+      // Anything else after the digits ends the number ("12-3" -> 12)
+      break;
+    } else if (ch === '-') {
+      // A leading minus marks a negative amount
+      negative = true;
+    }
+  }
+
+  if (!digits) return 0;
+
+  // Decide which separator is the decimal point:
+  // - both present ("1.234,56" / "1,234.56"): the last one
+  // - only one kind, used once ("12,50" / "12.50" / "1,234"): always treated
+  //   as the decimal point, never as thousands grouping
+  // - one kind used repeatedly ("1.234.567"): thousands grouping only
+  const hasDecimal = (commaCount > 0 && dotCount > 0) ||
+    (lastSep === ',' ? commaCount === 1 : dotCount === 1);
+
+  const normalized = hasDecimal
+    ? `${digits.slice(0, lastSepAt)}.${digits.slice(lastSepAt)}`
+    : digits;
   
-  const parsed = parseFloat(cleanPrice);
-  return isNaN(parsed) ? 0 : parsed;
+  const parsed = parseFloat(normalized);
+  if (isNaN(parsed)) return 0;
+  return negative ? -parsed : parsed;
 };
 
 /**
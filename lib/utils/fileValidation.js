@@ -25,6 +25,21 @@ export const SUPPORTED_MIME_TYPES = [
 
 export const SUPPORTED_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.webp', '.heic', '.heif'];
 
+// Set views for constant-time membership checks during validation
+const SUPPORTED_MIME_TYPE_SET = new Set(SUPPORTED_MIME_TYPES);
+const SUPPORTED_EXTENSION_SET = new Set(SUPPORTED_EXTENSIONS);
+
+/**
+ * Get the lowercase extension (including the dot) of a file name
+ * 
+ * @param {string} name - File name
+ * @returns {string} Extension such as '.jpg', or '' if none
+ */
+const getExtension = (name) => {
+  const dot = name ? name.lastIndexOf('.') : -1;
+  return dot === -1 ? '' : name.slice(dot).toLowerCase();
+};
+
 /**
  * Validate file for upload context
  * 
@@ -61,8 +76,8 @@ export const validateFile = (file, context = 'upload') => {
   }
 
   // Validate file type
-  const isValidType = SUPPORTED_MIME_TYPES.includes(file.type) || 
-                     SUPPORTED_EXTENSIONS.some(ext => file.name?.toLowerCase().endsWith(ext));
+  const isValidType = SUPPORTED_MIME_TYPE_SET.has(file.type) || 
+                     SUPPORTED_EXTENSION_SET.has(getExtension(file.name));
   
   if (!isValidType) {
     result.isValid = false;
@@ -0,0 +1,62 @@
+/**
+ * Google Cloud Client Utilities for ZiCount
+ *
+ * Shared Document AI and Cloud Storage clients for the API routes. Creating a
+ * client parses credentials and sets up auth/transport, so each client is
+ * cached on the global object (like the MongoDB client in lib/db/mongodb.js)
+ * and reused by warm serverless invocations and dev hot reloads.
+ */
+
+import { DocumentProcessorServiceClient } from '@google-cloud/documentai';
+import { Storage } from '@google-cloud/storage';
+
+/**
+ * Get the shared Google Cloud Document AI client
+ *
+ * Credential strategy:
+ * - GOOGLE_APPLICATION_CREDENTIALS_JSON: service account key from env (Vercel)
+ * - otherwise: GOOGLE_APPLICATION_CREDENTIALS file path (local development)
+ *
+ * @returns {DocumentProcessorServiceClient} Document AI client
+ */
+export function getDocumentAIClient() {
+  if (!global._documentAIClient) {
+    if (process.env.GOOGLE_APPLICATION_CREDENTIALS_JSON) {
+      const serviceAccountKey = JSON.parse(process.env.GOOGLE_APPLICATION_CREDENTIALS_JSON);
+      global._documentAIClient = new DocumentProcessorServiceClient({
+        credentials: serviceAccountKey,
+        projectId: serviceAccountKey.project_id
+      });
+    } else {
+      global._documentAIClient = new DocumentProcessorServiceClient();
+    }
+  }
+  return global._documentAIClient;
+}
+
+/**
+ * Get the shared Google Cloud Storage client
+ *
+ * Credential strategy:
+ * - development with GOOGLE_APPLICATION_CREDENTIALS: key file path
+ * - GOOGLE_APPLICATION_CREDENTIALS_JSON: service account key from env (Vercel)
+ *
+ * @returns {Storage|null} Storage client, or null if no credentials are configured
+ */
+export function getStorageClient() {
+  if (global._gcsStorageClient) return global._gcsStorageClient;
+
+  let storage = null;
+  if (process.env.NODE_ENV === 'development' && process.env.GOOGLE_APPLICATION_CREDENTIALS) {
+    storage = new Storage();
+  } else if (process.env.GOOGLE_APPLICATION_CREDENTIALS_JSON) {
+    const serviceAccountKey = JSON.parse(process.env.GOOGLE_APPLICATION_CREDENTIALS_JSON);
+    storage = new Storage({
+      credentials: serviceAccountKey,
+      projectId: serviceAccountKey.project_id
+    });
+  }
+
+  if (storage) global._gcsStorageClient = storage;
+  return storage;
+}
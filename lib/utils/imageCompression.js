@@ -68,14 +68,18 @@ export const compressImageForStorage = (file, options = {}) => {
           const newW = Math.max(1, Math.floor(canvas.width * scaleFactor));
           const newH = Math.max(1, Math.floor(canvas.height * scaleFactor));
           
-          const canvas2 = document.createElement('canvas');
-          canvas2.width = newW;
-          canvas2.height = newH;
-          const ctx2 = canvas2.getContext('2d');
-          ctx2.drawImage(img, 0, 0, newW, newH);
+          // Reuse the existing canvas and context; resizing clears the bitmap
+          canvas.width = newW;
+          canvas.height = newH;
+          ctx.drawImage(img, 0, 0, newW, newH);
           
           quality = Math.max(minQuality, quality - 0.05);
-          blob = await canvasToBlob(canvas2, 'image/jpeg', quality);
+          blob = await canvasToBlob(canvas, 'image/jpeg', quality);
+        }
+
+        // canvas.toBlob yields null when encoding fails; don't wrap that in a File
+        if (!blob) {
+          throw new Error('Failed to encode compressed image');
         }
 
         const outName = (file.name || 'upload').replace(/\.[^/.]+$/, '') + '.jpg';
@@ -141,10 +145,12 @@ export const createThumbnailFromDataUrl = (dataUrl, maxWidth = 1024, quality = 0
 export const createPreviewFromFile = (file, maxWidth = 1024) => {
   return new Promise((resolve, reject) => {
     try {
-      const reader = new FileReader();
-      reader.onload = (e) => {
-        const img = new Image();
-        img.onload = () => {
+      // Decode straight from the file via an object URL rather than reading it
+      // into a full-size base64 data URL first and decoding that string again
+      const img = new Image();
+      const objectUrl = URL.createObjectURL(file);
+      img.onload = () => {
+        try {
           const canvas = document.createElement('canvas');
           const ctx = canvas.getContext('2d');
           const scale = Math.min(1, maxWidth / img.width);
@@ -153,12 +159,17 @@ export const createPreviewFromFile = (file, maxWidth = 1024) => {
           ctx.drawImage(img, 0, 0, canvas.width, canvas.height);
           const resizedDataUrl = canvas.toDataURL('image/jpeg', 0.8);
           resolve(resizedDataUrl);
-        };
-        img.onerror = () => reject(new Error('Failed to process image for preview'));
-        img.src = e.target.result;
+        } catch (err) {
+          reject(err);
+        } finally {
+          URL.revokeObjectURL(objectUrl);
+        }
+      };
+      img.onerror = () => {
+        URL.revokeObjectURL(objectUrl);
+        reject(new Error('Failed to process image for preview'));
       };
-      reader.onerror = () => reject(new Error('Failed to read file'));
-      reader.readAsDataURL(file);
+      img.src = objectUrl;
     } catch (err) {
       reject(err);
     }
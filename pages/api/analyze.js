@@ -13,9 +13,9 @@
  * - Handles common OCR errors (e.g., "11" -> "1l" for liter measurements)
  */
 
-import { DocumentProcessorServiceClient } from '@google-cloud/documentai';
-import { Storage } from '@google-cloud/storage';
 import { checkMethod, errorResponse } from '@/lib/utils/apiHelpers';
+import { parsePrice } from '@/lib/utils/currency';
+import { getDocumentAIClient, getStorageClient } from '@/lib/utils/googleClients';
 
 // Disable Next.js default body parser to handle JSON
 export const config = {
@@ -25,6 +25,66 @@ export const config = {
 };
 
 
+// Common OCR misreads of the liter unit "l" as "1", fused into one pattern so
+// each item name is scanned once:
+//   0,331 -> 0,33l   (decimal volume with trailing 1)
+//   11    -> 1l      (standalone 11)
+const VOLUME_OCR_FIX_RE = /(\d+[,\.]\d+)1(\s|$)|\b11(\s|$)/g;
+
+/**
+ * Fix common OCR errors for volume measurements in an item name
+ *
+ * @param {string} name - Item name as recognized by Document AI
+ * @returns {string} Name with liter units corrected
+ */
+function fixVolumeOcrErrors(name) {
+  // Fast path: both corrections need a "1", which most item names don't contain
+  if (!name.includes('1')) return name;
+  return name.replace(VOLUME_OCR_FIX_RE, (match, volume, volumeEnd, literEnd) =>
+    volume !== undefined ? `${volume}l${volumeEnd}` : `1l${literEnd}`
+  );
+}
+
+/**
+ * Find the unused price closest to a vertical position
+ *
+ * Prices are sorted by position, so a binary search locates the insertion
+ * point and only the nearest unused neighbours on either side are compared,
+ * instead of scanning every price for every item. Ties resolve to the lowest
+ * index, matching a left-to-right linear scan.
+ *
+ * @param {Array} prices - Prices sorted ascending by position
+ * @param {Set<number>} usedPrices - Indices of prices already matched
+ * @param {number} position - Item position to match
+ * @returns {number} Index of the closest unused price, or -1 if none left
+ */
+function findClosestUnusedPrice(prices, usedPrices, position) {
+  // Binary search for the first price at or below the item
+  let lo = 0;
+  let hi = prices.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (prices[mid].position < position) lo = mid + 1;
+    else hi = mid;
+  }
+
+  // Nearest unused price on each side of the insertion point
+  let left = lo - 1;
+  while (left >= 0 && usedPrices.has(left)) left--;
+  let right = lo;
+  while (right < prices.length && usedPrices.has(right)) right++;
+
+  const leftDistance = left >= 0 ? position - prices[left].position : Infinity;
+  const rightDistance = right < prices.length ? prices[right].position - position : Infinity;
+  if (leftDistance === Infinity && rightDistance === Infinity) return -1;
+  if (rightDistance < leftDistance) return right;
+
+  // Prefer the lowest index among unused prices sharing the same position
+  for (let i = left - 1; i >= 0 && prices[i].position === prices[left].position; i--) {
+    if (!usedPrices.has(i)) left = i;
+  }
+  return left;
+}
 
 /**
  * Main API handler for receipt analysis
@@ -49,20 +109,8 @@ export default async function handler(req, res) {
       return res.status(400).json({ error: 'No GCS URL provided' });
     }
 
-    // Initialize Google Cloud Document AI client
-    let client;
-    
-    if (process.env.GOOGLE_APPLICATION_CREDENTIALS_JSON) {
-      // For Vercel deployment - use service account key from environment variable
-      const serviceAccountKey = JSON.parse(process.env.GOOGLE_APPLICATION_CREDENTIALS_JSON);
-      client = new DocumentProcessorServiceClient({
-        credentials: serviceAccountKey,
-        projectId: serviceAccountKey.project_id
-      });
-    } else {
-      // For local development - use GOOGLE_APPLICATION_CREDENTIALS file path
-      client = new DocumentProcessorServiceClient();
-    }
+    // Reuse the Document AI client (and its authenticated gRPC channel) across requests
+    const client = getDocumentAIClient();
     
     // Build processor resource name using environment variables
     const location = process.env.DOC_AI_LOCATION || 'us';
@@ -109,9 +157,7 @@ export default async function handler(req, res) {
         if (entity.type === 'items') {
           const itemName = entity.mentionText?.trim() || '';
           // Fix common OCR errors for volume measurements
-          const correctedName = itemName
-            .replace(/(\d+[,\.]\d+)1(\s|$)/g, '$1l$2')  // 0,331 -> 0,33l
-            .replace(/\b11(\s|$)/g, '1l$1')             // 11 -> 1l
+          const correctedName = fixVolumeOcrErrors(itemName);
           
           itemsWithPositions.push({
             name: correctedName,
@@ -121,7 +167,7 @@ export default async function handler(req, res) {
           const price = entity.normalizedValue?.moneyValue
             ? parseFloat(entity.normalizedValue.moneyValue.units || 0) + 
               parseFloat(entity.normalizedValue.moneyValue.nanos || 0) / 1000000000
-            : parseFloat(entity.mentionText?.replace(',', '.')) || 0;
+            : parsePrice(entity.mentionText);
           
           pricesWithPositions.push({
             price: price,
@@ -133,7 +179,7 @@ export default async function handler(req, res) {
           const discountAmount = entity.normalizedValue?.moneyValue
             ? parseFloat(entity.normalizedValue.moneyValue.units || 0) + 
               parseFloat(entity.normalizedValue.moneyValue.nanos || 0) / 1000000000
-            : parseFloat(entity.mentionText?.replace(',', '.')) || 0;
+            : parsePrice(entity.mentionText);
           discountAmounts.push(Math.abs(discountAmount));
         } else if (entity.type === 'sum') {
           // Only use sum from Document AI, never calculate fallback
@@ -141,9 +187,8 @@ export default async function handler(req, res) {
             totalAmount = parseFloat(entity.normalizedValue.moneyValue.units || 0) + 
               parseFloat(entity.normalizedValue.moneyValue.nanos || 0) / 1000000000;
           } else if (entity.mentionText) {
-            // Clean the sum text by removing letters and keeping only numbers, commas, and dots
-            const cleanedSumText = entity.mentionText.replace(/[^\d,.-]/g, '').replace(',', '.');
-            totalAmount = parseFloat(cleanedSumText) || 0;
+            // Parse the sum text, ignoring currency symbols and letters
+            totalAmount = parsePrice(entity.mentionText);
           }
         }
       }
@@ -160,23 +205,10 @@ export default async function handler(req, res) {
       
       // First pass: match items with their closest prices
       for (const itemData of mergedItems) {
-        let closestPrice = null;
-        let closestDistance = Infinity;
-        let closestIndex = -1;
-        
         // Find the closest unused price to this item
-        for (let i = 0; i < pricesWithPositions.length; i++) {
-          if (usedPrices.has(i)) continue; // Skip already used prices
-          
-          const priceData = pricesWithPositions[i];
-          const distance = Math.abs(itemData.position - priceData.position);
-          
-          if (distance < closestDistance) {
-            closestDistance = distance;
-            closestPrice = priceData;
-            closestIndex = i;
-          }
-        }
+        const closestIndex = findClosestUnusedPrice(pricesWithPositions, usedPrices, itemData.position);
+        const closestPrice = closestIndex === -1 ? null : pricesWithPositions[closestIndex];
+        const closestDistance = closestPrice ? Math.abs(itemData.position - closestPrice.position) : Infinity;
         
         // If we found a reasonable match (not too far apart), use it
         if (closestPrice && closestDistance < 0.1) { // Reasonable proximity threshold
@@ -250,44 +282,28 @@ export default async function handler(req, res) {
         }
       }
     }
-    // Try to fetch the image bytes from GCS and delete the object to avoid
-    // leaving large files in the bucket. This helps keep GCS as a temporary
-    // staging location for Document AI processing only.
-    let imageBase64 = null;
+    // Delete the staged object from GCS to avoid leaving large files in the
+    // bucket. This keeps GCS as a temporary staging location for Document AI
+    // processing only.
     let deletedFromGCS = false;
     try {
       // Parse gs://bucket/filename
       const match = (gcsUrl || '').match(/^gs:\/\/([^/]+)\/(.+)$/);
-      if (match) {
+      // Shared Storage client with the same credential strategy as other endpoints.
+      // If no credentials available, skip deleting but continue returning the analysis
+      const storage = match ? getStorageClient() : null;
+
+      if (storage) {
         const bucketName = match[1];
         const filename = match[2];
-
-        // Initialize Storage client with the same credential strategy as other endpoints
-        let storage;
-        if (process.env.NODE_ENV === 'development' && process.env.GOOGLE_APPLICATION_CREDENTIALS) {
-          storage = new Storage();
-        } else if (process.env.GOOGLE_APPLICATION_CREDENTIALS_JSON) {
-          const serviceAccountKey = JSON.parse(process.env.GOOGLE_APPLICATION_CREDENTIALS_JSON);
-          storage = new Storage({ credentials: serviceAccountKey, projectId: serviceAccountKey.project_id });
-        } else {
-          // If no credentials available, skip fetching/deleting but continue returning the analysis
-          storage = null;
-        }
-
-        if (storage) {
-          const bucket = storage.bucket(bucketName);
-          const file = bucket.file(filename);
-          // Avoid downloading the full image into memory and embedding it in the response.
-          // Large base64 payloads can exceed serverless response limits and slow the client.
-          // Only attempt to delete the temporary GCS object and report the deletion result.
-          try {
-            await file.delete();
-            deletedFromGCS = true;
-          } catch (delErr) {
-            console.warn('Failed to delete GCS file:', delErr.message || delErr);
-            deletedFromGCS = false;
-          }
-          imageBase64 = null;
+        // Avoid downloading the full image into memory and embedding it in the response.
+        // Large base64 payloads can exceed serverless response limits and slow the client.
+        // Only attempt to delete the temporary GCS object and report the deletion result.
+        try {
+          await storage.bucket(bucketName).file(filename).delete();
+          deletedFromGCS = true;
+        } catch (delErr) {
+          console.warn('Failed to delete GCS file:', delErr.message || delErr);
         }
       }
     } catch (err) {
@@ -299,7 +315,7 @@ export default async function handler(req, res) {
       discounts: discounts,
       totalAmount: totalAmount,
       currency: 'EUR',
-      imageBase64,
+      imageBase64: null,
       deletedFromGCS
     });
 
@@ -1,4 +1,4 @@
-import { Storage } from '@google-cloud/storage';
+import { getStorageClient } from '@/lib/utils/googleClients';
 import { checkMethod } from '@/lib/utils/apiHelpers';
 
 export default async function handler(req, res) {
@@ -13,19 +13,9 @@ export default async function handler(req, res) {
       return res.status(500).json({ error: 'Missing Google Cloud credentials' });
     }
 
-    // Initialize Storage client with credentials
-    let storage;
-    if (process.env.NODE_ENV === 'development' && process.env.GOOGLE_APPLICATION_CREDENTIALS) {
-      // For local development - use GOOGLE_APPLICATION_CREDENTIALS file path
-      storage = new Storage();
-    } else if (process.env.GOOGLE_APPLICATION_CREDENTIALS_JSON) {
-      // For Vercel deployment - use service account key from environment variable
-      const serviceAccountKey = JSON.parse(process.env.GOOGLE_APPLICATION_CREDENTIALS_JSON);
-      storage = new Storage({
-        credentials: serviceAccountKey,
-        projectId: serviceAccountKey.project_id
-      });
-    } else {
+    // Reuse the shared Storage client (file path in dev, env JSON key on Vercel)
+    const storage = getStorageClient();
+    if (!storage) {
       return res.status(500).json({ error: 'Missing Google Cloud credentials. Set GOOGLE_APPLICATION_CREDENTIALS (dev) or GOOGLE_APPLICATION_CREDENTIALS_JSON (prod)' });
     }
 
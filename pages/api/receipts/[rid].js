@@ -14,8 +14,13 @@ export default async function handler(req, res) {
       if (!receipt) return res.status(404).json({ error: 'Receipt not found' });
 
       const claims = await db.collection('claims').find({ receiptId: receipt._id.toString() }).toArray();
+      // Resolve each item's claim once instead of scanning claims per item
+      const claimByItem = new Map();
+      for (const c of claims) {
+        if (!claimByItem.has(c.itemId)) claimByItem.set(c.itemId, c);
+      }
       const receiptItems = receipt.items?.map(item => {
-        const claim = claims.find(c => c.itemId === item.id);
+        const claim = claimByItem.get(item.id);
         return claim ? { ...item, claimedBy: claim.userId, claimedAt: claim.claimedAt } : item;
       }) || [];
       
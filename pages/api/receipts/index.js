@@ -30,8 +30,13 @@ export default async function handler(req, res) {
 
       const receiptsWithClaims = receipts.map(receipt => {
         const receiptClaims = claimsByReceipt[receipt._id.toString()] || [];
+        // Resolve each item's claim once per receipt instead of scanning claims per item
+        const claimByItem = new Map();
+        for (const c of receiptClaims) {
+          if (!claimByItem.has(c.itemId)) claimByItem.set(c.itemId, c);
+        }
         const receiptItems = receipt.items?.map(item => {
-          const claim = receiptClaims.find(c => c.itemId === item.id);
+          const claim = claimByItem.get(item.id);
           return claim ? { ...item, claimedBy: claim.userId, claimedAt: claim.claimedAt } : item;
         }) || [];
         
@@ -17,11 +17,26 @@ export default async function handler(req, res) {
       const latest = getLatestTimestamp([...claims, ...receipts]);
       if (latest && handleConditionalGet(res, req, latest)) return;
       
+      // Index receipts and their items once so each claim resolves in O(1)
+      const receiptsById = new Map();
+      const itemsByReceipt = new Map();
+      for (const receipt of receipts) {
+        const rid = receipt._id.toString();
+        if (receiptsById.has(rid)) continue;
+        receiptsById.set(rid, receipt);
+
+        const itemsById = new Map();
+        for (const item of receipt.items || []) {
+          if (!itemsById.has(item.id)) itemsById.set(item.id, item);
+        }
+        itemsByReceipt.set(rid, itemsById);
+      }
+
       const claimsWithDetails = claims.map(claim => {
-        const receipt = receipts.find(r => r._id.toString() === claim.receiptId);
+        const receipt = receiptsById.get(claim.receiptId);
         if (!receipt) return null;
         
-        const item = receipt.items?.find(item => item.id === claim.itemId);
+        const item = itemsByReceipt.get(claim.receiptId).get(claim.itemId);
         if (!item) return null;
         
         return {